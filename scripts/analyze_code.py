@@ -14,15 +14,93 @@ This Python version provides:
 
 import os
 import sys
+import shutil
 import subprocess
+import tempfile
 import json
+import pickle
 import re
 import configparser
-from datetime import datetime
-from typing import List, Dict, Tuple, Optional
+import bisect
+import hashlib
+import heapq
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterable, List, Dict, TextIO, Tuple, Optional
 from dataclasses import dataclass
 from pathlib import Path
 
+try:
+    import ijson
+except ImportError:  # Optional: gosec reports are then parsed in one piece
+    ijson = None
+
+
+# Line formats of the tools whose output is parsed line by line
+_GOCYCLO_RE = re.compile(r'^(\d+)\s+(\S+)\s+(\S+)\s+(.+):(\d+):\d+$')
+_GOCOGNIT_RE = re.compile(r'^(\d+)\s+(\S+)\s+(\S+)\s+(.+):(\d+)$')
+_GOCONST_RE = re.compile(r'^(.+):(\d+):\d+: (.+)$')
+_STATICCHECK_RE = re.compile(r'^(.+):(\d+):(\d+):\s+(.+?)\s*(?:\(([^)]+)\))?$')
+_FILE_LINE_MSG_RE = re.compile(r'^(.+):(\d+):(\d+): (.+)$')
+_GOLANGCI_RE = re.compile(r'^(.+):(\d+):(\d+):\s+(.+?)\s+\(([^)]+)\)$')
+# The percentage is optional so that "coverage: [no statements]" lines still match
+_COVERAGE_RE = re.compile(r'coverage: ([0-9.]+%)?')
+
+# Errors raised while decoding a gosec JSON report
+_GOSEC_ERRORS = (json.JSONDecodeError, KeyError, ValueError) + ((ijson.JSONError,) if ijson else ())
+
+# Python creates its descriptors non-inheritable (PEP 446), so on POSIX
+# close_fds has nothing to close; leaving it off enables posix_spawn().
+_CLOSE_FDS = os.name != 'posix'
+
+# Complexity bands: values up to each limit map to the label at the same index
+_COMPLEXITY_EMOJI_LIMITS = (10, 15, 25)
+_COMPLEXITY_EMOJIS = ("✅", "⚠️", "🔶", "🔴")
+_PRIORITY_LIMITS = (15, 20, 25)
+_PRIORITY_LEVELS = ("✅ **Low**", "⚠️ **Medium**", "🔶 **High**", "🔴 **Critical**")
+
+# Go settings that change what the tools report, hashed into result cache keys
+_GO_ENV_KEYS = ('GOFLAGS', 'GOOS', 'GOARCH', 'CGO_ENABLED', 'GOEXPERIMENT')
+
+# Upper bound on analyses run at the same time by CodeAnalyzer.run_all()
+_MAX_ANALYSIS_WORKERS = 8
+
+# Files per `wc -l` invocation, keeping the command line well under ARG_MAX
+_WC_BATCH_SIZE = 500
+
+# Serializes console output from analyzers running on worker threads
+_print_lock = threading.Lock()
+
+
+def _substring_pattern(substrings: List[str]) -> Optional[re.Pattern]:
+    """Compile a regex matching any of the given substrings, or None if empty."""
+    if not substrings:
+        return None
+    return re.compile('|'.join(re.escape(s) for s in substrings))
+
+
+def _strip_dot_slash(path: str) -> str:
+    """Make a "./"-prefixed tool path relative to the project root."""
+    return path[2:] if path.startswith('./') else path
+
+
+def _count_lines(path: str) -> int:
+    """Count newline characters in a file, as `wc -l` does.
+    
+    Reads raw bytes in 1 MiB chunks rather than decoding and splitting lines.
+    """
+    with open(path, 'rb', buffering=0) as f:
+        return sum(chunk.count(b'\n') for chunk in iter(lambda: f.read(1 << 20), b''))
+
+
+def _safe_count_lines(path: str) -> int:
+    """Count lines like _count_lines(), treating unreadable files as empty."""
+    try:
+        return _count_lines(path)
+    except OSError:
+        return 0
+
 
 @dataclass
 class ComplexityEntry:
@@ -81,6 +159,62 @@ class CodeMetrics:
     package_metrics: List[Dict[str, any]]
 
 
+# INI options as (section, option, AnalysisConfig attribute, getter name)
+_CONFIG_OPTIONS = [
+    ('analysis', 'output_file', 'output_file', 'get'),
+    ('analysis', 'complexity_threshold', 'complexity_threshold', 'getint'),
+    ('analysis', 'top_functions', 'top_functions', 'getint'),
+    ('analysis', 'exclude_test_files', 'exclude_test_files', 'getboolean'),
+    ('analysis', 'exclude_vendor', 'exclude_vendor', 'getboolean'),
+    ('analysis', 'exclude_examples', 'exclude_examples', 'getboolean'),
+    ('analysis', 'cache_dir', 'cache_dir', 'get'),
+    ('analysis', 'test_parallelism', 'test_parallelism', 'getint'),
+    ('analysis', 'cache_results', 'cache_results', 'getboolean'),
+    ('analysis', 'project_name', 'project_name', 'get'),
+    ('analysis', 'package_pattern', 'package_pattern', 'get'),
+    ('deadcode', 'exclude_public_interfaces', 'deadcode_exclude_public_interfaces', 'getboolean'),
+]
+
+# Comma-separated list options as (section, option, AnalysisConfig attribute)
+_CONFIG_LIST_OPTIONS = [
+    ('deadcode', 'exclude_files', 'deadcode_exclude_files'),
+    ('deadcode', 'exclude_functions', 'deadcode_exclude_functions'),
+]
+
+# Settings read from INI files, keyed by (absolute path, mtime in ns)
+_CONFIG_CACHE: Dict[Tuple[str, int], Dict[str, any]] = {}
+
+
+def _read_config_file(config_file: str) -> Dict[str, any]:
+    """Read the settings an INI file defines, keyed by AnalysisConfig attribute.
+    
+    Values are already converted and list options already split. Results are
+    cached until the file changes, so repeated configurations built from the
+    same file parse it only once.
+    """
+    path = os.path.abspath(config_file)
+    key = (path, os.stat(path).st_mtime_ns)
+    if key in _CONFIG_CACHE:
+        return _CONFIG_CACHE[key]
+    
+    config = configparser.ConfigParser()
+    config.read(path)
+    
+    settings = {}
+    for section, option, attribute, getter in _CONFIG_OPTIONS:
+        if config.has_option(section, option):
+            settings[attribute] = getattr(config[section], getter)(option)
+    
+    for section, option, attribute in _CONFIG_LIST_OPTIONS:
+        if config.has_option(section, option):
+            value = config[section][option]
+            if value:
+                settings[attribute] = [f.strip() for f in value.split(',')]
+    
+    _CONFIG_CACHE[key] = settings
+    return settings
+
+
 class AnalysisConfig:
     """Configuration for the analysis."""
     
@@ -95,6 +229,9 @@ class AnalysisConfig:
         self.deadcode_exclude_files = ["demo/", "interfaces.go"]
         self.deadcode_exclude_functions = []
         self.deadcode_exclude_public_interfaces = True  # Skip public funcs in interface files
+        self.cache_dir = ""  # Empty: tools use their default cache locations
+        self.test_parallelism = 0  # 0: Go's default (GOMAXPROCS)
+        self.cache_results = False  # Reuse parsed tool results while sources are unchanged
         self.project_name = "Go Project"
         self.package_pattern = "github.com/*/batchexec"  # Generic pattern
         
@@ -106,40 +243,206 @@ class AnalysisConfig:
     
     def _load_from_file(self, config_file: str):
         """Load configuration from INI file."""
-        config = configparser.ConfigParser()
-        config.read(config_file)
-        
-        if 'analysis' in config:
-            section = config['analysis']
-            self.output_file = section.get('output_file', self.output_file)
-            self.complexity_threshold = section.getint('complexity_threshold', self.complexity_threshold)
-            self.top_functions = section.getint('top_functions', self.top_functions)
-            self.exclude_test_files = section.getboolean('exclude_test_files', self.exclude_test_files)
-            self.exclude_vendor = section.getboolean('exclude_vendor', self.exclude_vendor)
-            self.exclude_examples = section.getboolean('exclude_examples', self.exclude_examples)
-            self.project_name = section.get('project_name', self.project_name)
-            self.package_pattern = section.get('package_pattern', self.package_pattern)
-        
-        if 'deadcode' in config:
-            section = config['deadcode']
-            exclude_files = section.get('exclude_files', '')
-            if exclude_files:
-                self.deadcode_exclude_files = [f.strip() for f in exclude_files.split(',')]
-            
-            exclude_functions = section.get('exclude_functions', '')
-            if exclude_functions:
-                self.deadcode_exclude_functions = [f.strip() for f in exclude_functions.split(',')]
-            
-            self.deadcode_exclude_public_interfaces = section.getboolean('exclude_public_interfaces', self.deadcode_exclude_public_interfaces)
+        for attribute, value in _read_config_file(config_file).items():
+            # Copy lists so instances never share the cached values
+            setattr(self, attribute, list(value) if isinstance(value, list) else value)
     
 
 class CodeAnalyzer:
     """Main code analysis class."""
     
+    # Independent analyses run by run_all(), as (result name, method name);
+    # result names match the parameters of _build_report()
+    ANALYSES = [
+        ('complexity_data', 'get_complexity_data'),
+        ('cognitive_complexity', 'get_cognitive_complexity'),
+        ('static_analysis', 'get_static_analysis'),
+        ('vet_analysis', 'get_vet_analysis'),
+        ('staticcheck_analysis', 'get_staticcheck_analysis'),
+        ('security_issues', 'get_security_analysis'),
+        ('vulnerabilities', 'get_vulnerability_analysis'),
+        ('code_smells', 'get_code_smells'),
+        ('deadcode_analysis', 'get_deadcode_analysis'),
+        ('architecture_violations', 'get_architecture_analysis'),
+        ('metrics', 'get_code_metrics'),
+    ]
+    
+    # Analyses whose results may be cached on disk, with the tool each runs.
+    # Vulnerabilities depend on an online database and metrics run the
+    # tests, so neither is cached.
+    CACHED_ANALYSES = {
+        'complexity_data': 'gocyclo',
+        'cognitive_complexity': 'gocognit',
+        'static_analysis': 'golangci-lint',
+        'vet_analysis': 'go',
+        'staticcheck_analysis': 'staticcheck',
+        'security_issues': 'gosec',
+        'code_smells': 'goconst',
+        'deadcode_analysis': 'deadcode',
+        'architecture_violations': 'go-cleanarch',
+    }
+    
     def __init__(self, config: AnalysisConfig):
         self.config = config
         self.project_root = Path.cwd()
+        self._packages: Optional[List[str]] = None
+        self._packages_lock = threading.Lock()
+        self._go_files_cache: Optional[List[str]] = None
+        self._tool_env = self._build_tool_env()
+        self._tool_paths: Dict[str, str] = {}
+        self._results_key: Optional[str] = None
+        self._results_key_lock = threading.Lock()
+        self._analysis_state = threading.local()  # Per worker: did the running analysis fail?
+        
+    def _build_tool_env(self) -> Optional[Dict[str, str]]:
+        """Build the environment for tool runs, keeping Go caches in cache_dir.
+        
+        Returns None (inherit the environment as is) unless cache_dir is
+        configured. Cache locations already set in the environment win.
+        """
+        if not self.config.cache_dir:
+            return None
+        
+        cache_dir = Path(self.config.cache_dir).expanduser().resolve()
+        cache_dir.mkdir(parents=True, exist_ok=True)
         
+        env = dict(os.environ)
+        env.setdefault('GOCACHE', str(cache_dir / 'go-build'))
+        env.setdefault('GOLANGCI_LINT_CACHE', str(cache_dir / 'golangci-lint'))
+        env.setdefault('STATICCHECK_CACHE', str(cache_dir / 'staticcheck'))
+        return env
+    
+    def _log(self, message: str) -> None:
+        """Print a status message without interleaving with other threads."""
+        with _print_lock:
+            print(message)
+    
+    def run_all(self) -> Dict[str, any]:
+        """Run all analyses concurrently and return their results by name.
+        
+        Each analysis mostly waits on its own external tool, so running them
+        side by side brings wall time down to roughly that of the slowest tool.
+        """
+        # Most tools use several cores themselves, so more workers only oversubscribe
+        max_workers = min(len(self.ANALYSES), os.cpu_count() or 1, _MAX_ANALYSIS_WORKERS)
+        results = {}
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self._run_analysis, name, method): name
+                       for name, method in self.ANALYSES}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        return results
+    
+    def _run_analysis(self, name: str, method: str) -> any:
+        """Run one analysis, reusing its cached result when allowed."""
+        if not self.config.cache_results or name not in self.CACHED_ANALYSES:
+            return getattr(self, method)()
+        
+        cache_file = self._results_cache_dir() / f"{name}-{self._results_cache_key(name)}.pkl"
+        try:
+            with cache_file.open('rb') as f:
+                result = pickle.load(f)
+            self._log(f"♻️  Reusing cached {name.replace('_', ' ')} results")
+            return result
+        except (OSError, EOFError, AttributeError, ImportError, pickle.PickleError):
+            pass
+        
+        self._analysis_state.failed = False
+        result = getattr(self, method)()
+        if not self._analysis_state.failed:
+            self._store_result(cache_file, result)
+        return result
+    
+    def _mark_failed(self) -> None:
+        """Record that the running analysis failed, so its result is not cached.
+        
+        Analyses report tool errors in their results rather than raising, so
+        this is how _run_analysis() tells a failed run from a clean one.
+        """
+        self._analysis_state.failed = True
+    
+    def _results_cache_dir(self) -> Path:
+        """Directory holding cached analysis results."""
+        if self.config.cache_dir:
+            return Path(self.config.cache_dir).expanduser().resolve() / 'analyze_code'
+        return self.project_root / '.cache' / 'analyze_code'
+    
+    def _results_cache_key(self, name: str) -> str:
+        """Key for the cached result of one analysis.
+        
+        The inputs every analysis shares (Go sources, module files, lint
+        configuration, Go build settings, this script and the analysis
+        settings) are hashed once, then combined with the path and mtime of
+        the tools it runs.
+        """
+        with self._results_key_lock:
+            if self._results_key is None:
+                digest = hashlib.blake2b(digest_size=16)
+                digest.update(Path(__file__).read_bytes())
+                settings = sorted((k, v) for k, v in vars(self.config).items() if k != 'output_file')
+                digest.update(repr(settings).encode())
+                digest.update(self._go_env_fingerprint().encode())
+                
+                for path in sorted(self._walk_go_files(set())):
+                    stat = os.stat(path)
+                    digest.update(f"{path}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode())
+                
+                for filename in ('go.mod', 'go.sum', '.golangci.yml', '.golangci.yaml',
+                                 '.golangci.toml', '.golangci.json'):
+                    try:
+                        digest.update(filename.encode() + b'\0' + (self.project_root / filename).read_bytes())
+                    except OSError:
+                        pass
+                
+                self._results_key = digest.hexdigest()
+        
+        digest = hashlib.blake2b(self._results_key.encode(), digest_size=16)
+        for tool in ('go', self.CACHED_ANALYSES[name]):
+            path = self._resolve_tool([tool])[0]
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                mtime = 0
+            digest.update(f"{path}\0{mtime}\n".encode())
+        return digest.hexdigest()
+    
+    def _go_env_fingerprint(self) -> str:
+        """Describe the Go build settings (tags, target, cgo) the tools run with.
+        
+        Combines the variables as set in the environment with their effective
+        values from `go env`, which also covers `go env -w` and defaults.
+        """
+        env = self._tool_env or os.environ
+        fingerprint = '\n'.join(f"{key}={env.get(key, '')}" for key in _GO_ENV_KEYS)
+        try:
+            result = self._run_tool(['go', 'env'] + list(_GO_ENV_KEYS), check=True)
+            fingerprint += '\n' + result.stdout
+        except (OSError, subprocess.SubprocessError):
+            pass
+        return fingerprint
+    
+    def _store_result(self, cache_file: Path, result: any) -> None:
+        """Write an analysis result to the cache, removing its stale results.
+        
+        The result is written under a temporary name and renamed into place,
+        so an interrupted run never leaves a partial file behind.
+        """
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile('wb', dir=cache_file.parent, suffix='.tmp',
+                                             delete=False) as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(f.name, cache_file)
+            
+            prefix = cache_file.name.rpartition('-')[0] + '-'
+            for stale in cache_file.parent.glob(prefix + '*.pkl'):
+                if stale != cache_file:
+                    stale.unlink()
+        except (OSError, pickle.PickleError) as e:
+            self._log(f"⚠️  Could not cache {cache_file.name}: {e}")
+    
     def check_required_tools(self) -> bool:
         """Check if required tools are installed."""
         tools = ['gocyclo', 'golangci-lint', 'go', 'gosec', 'goconst', 'gocognit', 'guru', 'go-cleanarch', 'govulncheck', 'staticcheck', 'deadcode']
@@ -158,32 +461,87 @@ class CodeAnalyzer:
     
     def _command_exists(self, command: str) -> bool:
         """Check if a command exists in PATH."""
-        try:
-            subprocess.run([command, '--help'], 
-                          capture_output=True, 
-                          check=False, 
-                          timeout=10)
-            return True
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+        return shutil.which(command) is not None
+    
+    def _resolve_tool(self, cmd: List[str]) -> List[str]:
+        """Replace the command name with its absolute path, if found in PATH."""
+        path = self._tool_paths.get(cmd[0])
+        if path is None:
+            path = shutil.which(cmd[0]) or cmd[0]
+            self._tool_paths[cmd[0]] = path
+        return [path] + cmd[1:]
+    
+    def _run_tool(self, cmd: List[str], *, check: bool = False,
+                  timeout: Optional[float] = None) -> subprocess.CompletedProcess:
+        """Run a tool to completion, capturing its output as text.
+        
+        The command is launched by absolute path with close_fds off, which
+        lets CPython use posix_spawn() instead of fork() and exec().
+        """
+        return subprocess.run(self._resolve_tool(cmd),
+                              capture_output=True,
+                              text=True,
+                              check=check,
+                              timeout=timeout,
+                              env=self._tool_env,
+                              close_fds=_CLOSE_FDS)
+    
+    def _stream_tool(self, cmd: List[str],
+                     parse_lines: Callable[[Iterable[str]], any]) -> Tuple[any, int, str]:
+        """Run a tool and parse its stdout line by line as it is produced.
+        
+        Returns the parsed result, the exit code and the tool's stderr.
+        stderr is spooled to a temporary file so that a chatty tool cannot
+        block on a full pipe while stdout is still being read.
+        """
+        with tempfile.TemporaryFile(mode='w+') as stderr:
+            with subprocess.Popen(self._resolve_tool(cmd), stdout=subprocess.PIPE,
+                                  stderr=stderr, text=True, env=self._tool_env,
+                                  close_fds=_CLOSE_FDS) as proc:
+                result = parse_lines(proc.stdout)
+            stderr.seek(0)
+            return result, proc.returncode, stderr.read()
+    
+    def _list_packages(self) -> List[str]:
+        """List every Go package in the module, without exclusions.
+        
+        The result of `go list` is cached for the lifetime of the analyzer,
+        so every tool shares a single invocation. Raises
+        subprocess.SubprocessError if `go list` fails.
+        """
+        with self._packages_lock:
+            if self._packages is None:
+                result = self._run_tool(['go', 'list', './...'], check=True)
+                self._packages = [p.strip() for p in result.stdout.strip().split('\n') if p.strip()]
+            
+            return list(self._packages)
     
     def _get_package_list(self, as_args=False) -> List[str]:
         """Get list of Go packages, respecting exclusion settings."""
         try:
-            result = subprocess.run(['go', 'list', './...'], 
-                                  capture_output=True, text=True, check=True)
-            packages = [p.strip() for p in result.stdout.strip().split('\n') if p.strip()]
-            
-            if self.config.exclude_examples:
-                packages = [p for p in packages if '/examples/' not in p]
-                
-            return packages if as_args else packages
+            packages = self._list_packages()
         except subprocess.SubprocessError:
             return ['./...'] if as_args else []
+        
+        if self.config.exclude_examples:
+            packages = [p for p in packages if '/examples/' not in p]
+        
+        return packages
+    
+    def _packages_arg(self) -> List[str]:
+        """Package arguments for tools that take Go package patterns.
+        
+        Without exclusions every tool gets the single `./...` pattern, letting
+        it load the whole module at once. Go patterns cannot exclude
+        directories, so otherwise the filtered package list is passed.
+        """
+        if not self.config.exclude_examples:
+            return ['./...']
+        return self._get_package_list(as_args=True)
     
     def get_complexity_data(self) -> List[ComplexityEntry]:
         """Get cyclomatic complexity data using gocyclo."""
-        print("🧮 Analyzing cyclomatic complexity...")
+        self._log("🧮 Analyzing cyclomatic complexity...")
         
         cmd = ['gocyclo', '-over', '1']
         if self.config.exclude_test_files:
@@ -191,68 +549,66 @@ class CodeAnalyzer:
         cmd.append('.')
         
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-            if result.returncode != 0 and result.stderr:
-                print(f"⚠️  gocyclo warning: {result.stderr.strip()}")
+            entries, returncode, stderr = self._stream_tool(cmd, self._parse_complexity_output)
+            if returncode != 0 and stderr:
+                self._log(f"⚠️  gocyclo warning: {stderr.strip()}")
+            if stderr.strip():
+                self._mark_failed()
             
-            return self._parse_complexity_output(result.stdout)
+            return entries
         except subprocess.SubprocessError as e:
-            print(f"❌ Error running gocyclo: {e}")
+            self._log(f"❌ Error running gocyclo: {e}")
+            self._mark_failed()
             return []
     
-    def _parse_complexity_output(self, output: str) -> List[ComplexityEntry]:
-        """Parse gocyclo output into structured data."""
-        entries = []
-        
-        for line in output.strip().split('\n'):
-            if not line.strip():
-                continue
-                
-            # Parse line format: "15 main main main.go:28:1"
-            match = re.match(r'^(\d+)\s+(\S+)\s+(\S+)\s+(.+):(\d+):\d+$', line)
-            if match:
-                complexity = int(match.group(1))
-                package = match.group(2)
-                function = match.group(3)
-                file = match.group(4)
-                line_num = int(match.group(5))
-                
-                entries.append(ComplexityEntry(
-                    complexity=complexity,
-                    package=package,
-                    function=function,
-                    file=file,
-                    line=line_num
-                ))
-        
-        return sorted(entries, key=lambda x: x.complexity, reverse=True)
+    def _parse_complexity_output(self, lines: Iterable[str]) -> List[ComplexityEntry]:
+        """Parse gocyclo output lines into structured data."""
+        # Parse line format: "15 main main main.go:28:1"
+        return [entry for line in lines
+                if (entry := self._parse_complexity_line(line, _GOCYCLO_RE))]
+    
+    def _top_complexity(self, entries: List[ComplexityEntry], limit: int) -> List[ComplexityEntry]:
+        """Return the `limit` most complex entries, highest first."""
+        return heapq.nlargest(limit, entries, key=lambda x: x.complexity)
+    
+    def _parse_complexity_line(self, line: str, pattern: re.Pattern) -> Optional[ComplexityEntry]:
+        """Parse a single gocyclo or gocognit line, or return None if it does not match."""
+        # Both tools start every entry with the complexity score
+        if not line[:1].isdigit():
+            return None
+        
+        match = pattern.match(line)
+        if not match:
+            return None
+        
+        return ComplexityEntry(
+            complexity=int(match.group(1)),
+            package=match.group(2),
+            function=match.group(3),
+            file=match.group(4),
+            line=int(match.group(5))
+        )
     
     def get_static_analysis(self) -> Dict[str, any]:
         """Run golangci-lint for static analysis."""
-        print("🔧 Running static analysis...")
+        self._log("🔧 Running static analysis...")
         
         try:
             # First, try without configuration to avoid version conflicts
-            result = subprocess.run(['golangci-lint', 'run', '--no-config'], 
-                                  capture_output=True, 
-                                  text=True, 
-                                  check=False)
+            issues, returncode, stderr = self._stream_tool(['golangci-lint', 'run', '--no-config'],
+                                                           self._parse_golangci_output)
             
             # If no-config fails, try with configuration
-            if result.returncode != 0 and "unknown flag" in result.stderr:
-                result = subprocess.run(['golangci-lint', 'run'], 
-                                      capture_output=True, 
-                                      text=True, 
-                                      check=False)
-            
-            issues = []
-            if result.stdout.strip():
-                issues = self._parse_golangci_output(result.stdout)
+            if returncode != 0 and "unknown flag" in stderr:
+                issues, _, stderr = self._stream_tool(['golangci-lint', 'run'],
+                                                      self._parse_golangci_output)
             
             # Check if error is about version compatibility
-            error_msg = result.stderr.strip() if result.stderr.strip() else None
+            error_msg = stderr.strip() or None
             if error_msg and "configuration file for golangci-lint v2 with golangci-lint v1" in error_msg:
                 error_msg = "Version mismatch: Using golangci-lint v1 with v2 config. Consider upgrading golangci-lint or updating .golangci.yml"
+            if error_msg:
+                self._mark_failed()
             
             return {
                 'issues': issues,
@@ -261,6 +617,7 @@ class CodeAnalyzer:
             }
                 
         except subprocess.SubprocessError as e:
+            self._mark_failed()
             return {
                 'issues': [],
                 'error': f"Error running golangci-lint: {e}",
@@ -269,161 +626,163 @@ class CodeAnalyzer:
     
     def get_security_analysis(self) -> List[SecurityIssue]:
         """Run gosec for security analysis."""
-        print("🔒 Running security analysis...")
+        self._log("🔒 Running security analysis...")
         
         try:
-            packages = self._get_package_list()
-            if not packages:
-                return []
-                
-            cmd = ['gosec', '-fmt=json'] + packages
-            result = subprocess.run(cmd, 
-                                  capture_output=True, 
-                                  text=True, 
-                                  check=False)
+            cmd = ['gosec', '-fmt=json']
+            if self.config.exclude_examples:
+                cmd.append('-exclude-dir=examples')
+            cmd.append('./...')
+            if ijson is not None:
+                return self._stream_gosec_output(cmd)
+            
+            result = self._run_tool(cmd)
+            
+            # gosec exits with 1 when it finds issues; anything else is an error
+            if result.returncode not in (0, 1) or not result.stdout.strip():
+                self._mark_failed()
             
             if result.stdout.strip():
                 return self._parse_gosec_output(result.stdout)
             return []
             
         except subprocess.SubprocessError as e:
-            print(f"⚠️  Error running gosec: {e}")
+            self._log(f"⚠️  Error running gosec: {e}")
+            self._mark_failed()
             return []
     
+    def _stream_gosec_output(self, cmd: List[str]) -> List[SecurityIssue]:
+        """Run gosec and decode its JSON report incrementally with ijson.
+        
+        Only one issue object is materialized at a time, instead of the
+        whole report.
+        """
+        with subprocess.Popen(self._resolve_tool(cmd), stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL, env=self._tool_env,
+                              close_fds=_CLOSE_FDS) as proc:
+            issues = None
+            if proc.stdout.peek(1):
+                issues = self._parse_gosec_issues(ijson.items(proc.stdout, 'Issues.item'))
+        
+        # gosec exits with 1 when it finds issues; anything else is an error
+        if issues is None or proc.returncode not in (0, 1):
+            self._mark_failed()
+        return issues or []
+    
     def _parse_gosec_output(self, output: str) -> List[SecurityIssue]:
         """Parse gosec JSON output."""
-        issues = []
         try:
             data = json.loads(output)
-            if 'Issues' in data:
-                for issue in data['Issues']:
-                    file_path = issue.get('file', '')
-                    # Truncate absolute path to project relative path
-                    if file_path.startswith('/'):
-                        project_root = str(self.project_root)
-                        if file_path.startswith(project_root):
-                            file_path = file_path[len(project_root):].lstrip('/')
-                    
-                    issues.append(SecurityIssue(
-                        severity=issue.get('severity', 'UNKNOWN'),
-                        confidence=issue.get('confidence', 'UNKNOWN'),
-                        rule=issue.get('rule_id', ''),
-                        details=issue.get('details', ''),
-                        file=file_path,
-                        line=int(issue.get('line', 0))
-                    ))
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
-            print(f"⚠️  Error parsing gosec output: {e}")
+        except json.JSONDecodeError as e:
+            self._log(f"⚠️  Error parsing gosec output: {e}")
+            self._mark_failed()
+            return []
+        
+        return self._parse_gosec_issues(data.get('Issues') or [])
+    
+    def _parse_gosec_issues(self, items: Iterable[Dict[str, any]]) -> List[SecurityIssue]:
+        """Convert gosec issue objects into security issues."""
+        issues = []
+        project_root = str(self.project_root)
+        prefix_len = len(project_root)
+        try:
+            for issue in items:
+                file_path = issue.get('file', '')
+                # Truncate absolute path to project relative path
+                if file_path.startswith(project_root):
+                    file_path = file_path[prefix_len:].lstrip('/')
+                
+                issues.append(SecurityIssue(
+                    severity=issue.get('severity', 'UNKNOWN'),
+                    confidence=issue.get('confidence', 'UNKNOWN'),
+                    rule=issue.get('rule_id', ''),
+                    details=issue.get('details', ''),
+                    file=file_path,
+                    line=int(issue.get('line', 0))
+                ))
+        except _GOSEC_ERRORS as e:
+            self._log(f"⚠️  Error parsing gosec output: {e}")
+            self._mark_failed()
         
         return issues
     
     def get_cognitive_complexity(self) -> List[ComplexityEntry]:
         """Get cognitive complexity data using gocognit."""
-        print("🧠 Analyzing cognitive complexity...")
+        self._log("🧠 Analyzing cognitive complexity...")
         
         try:
-            result = subprocess.run(['gocognit', '-over', '10', '.'], 
-                                  capture_output=True, 
-                                  text=True, 
-                                  check=False)
-            
             # Parse and filter out test files if configured
-            entries = self._parse_gocognit_output(result.stdout)
+            entries, _, stderr = self._stream_tool(['gocognit', '-over', '10', '.'],
+                                                   self._parse_gocognit_output)
+            if stderr.strip():
+                self._mark_failed()
             if self.config.exclude_test_files:
                 entries = [e for e in entries if not ('_test.go' in e.file or e.function.startswith('Test') or e.function.startswith('Benchmark') or e.function.startswith('Example'))]
             
             return entries
             
         except subprocess.SubprocessError as e:
-            print(f"⚠️  Error running gocognit: {e}")
+            self._log(f"⚠️  Error running gocognit: {e}")
+            self._mark_failed()
             return []
     
-    def _parse_gocognit_output(self, output: str) -> List[ComplexityEntry]:
-        """Parse gocognit output."""
-        entries = []
-        
-        for line in output.strip().split('\n'):
-            if not line.strip():
-                continue
-                
-            # Parse line format: "15 main main main.go:28"
-            match = re.match(r'^(\d+)\s+(\S+)\s+(\S+)\s+(.+):(\d+)$', line)
-            if match:
-                complexity = int(match.group(1))
-                package = match.group(2)
-                function = match.group(3)
-                file = match.group(4)
-                line_num = int(match.group(5))
-                
-                entries.append(ComplexityEntry(
-                    complexity=complexity,
-                    package=package,
-                    function=function,
-                    file=file,
-                    line=line_num
-                ))
-        
-        return sorted(entries, key=lambda x: x.complexity, reverse=True)
+    def _parse_gocognit_output(self, lines: Iterable[str]) -> List[ComplexityEntry]:
+        """Parse gocognit output lines."""
+        # Parse line format: "15 main main main.go:28"
+        return [entry for line in lines
+                if (entry := self._parse_complexity_line(line, _GOCOGNIT_RE))]
     
     def get_code_smells(self) -> List[CodeSmell]:
         """Get code smells using goconst."""
-        print("👃 Detecting code smells...")
+        self._log("👃 Detecting code smells...")
         
         try:
-            packages = self._get_package_list()
-            if not packages:
-                return []
-                
-            cmd = ['goconst'] + packages
-            result = subprocess.run(cmd, 
-                                  capture_output=True, 
-                                  text=True, 
-                                  check=False)
+            cmd = ['goconst']
+            if self.config.exclude_examples:
+                cmd.extend(['-ignore', '(^|/)examples/'])
+            cmd.append('./...')
+            result = self._run_tool(cmd)
+            if result.returncode != 0 or result.stderr.strip():
+                self._mark_failed()
             
             return self._parse_goconst_output(result.stdout)
             
         except subprocess.SubprocessError as e:
-            print(f"⚠️  Error running goconst: {e}")
+            self._log(f"⚠️  Error running goconst: {e}")
+            self._mark_failed()
             return []
     
     def _parse_goconst_output(self, output: str) -> List[CodeSmell]:
         """Parse goconst output."""
-        smells = []
-        
-        for line in output.strip().split('\n'):
-            if not line.strip():
-                continue
-                
-            # Parse line format: "./path/file.go:123:45: string literal found 3 times"
-            match = re.match(r'^(.+):(\d+):\d+: (.+)$', line)
-            if match:
-                file = match.group(1)
-                line_num = int(match.group(2))
-                message = match.group(3)
-                
-                smells.append(CodeSmell(
-                    type="string_duplication",
-                    message=message,
-                    file=file,
-                    line=line_num
-                ))
-        
-        return smells
+        # Parse line format: "./path/file.go:123:45: string literal found 3 times"
+        # Lines with fewer than three colons cannot match and skip the regex.
+        return [
+            CodeSmell(
+                type="string_duplication",
+                message=match.group(3),
+                file=match.group(1),
+                line=int(match.group(2))
+            )
+            for line in output.splitlines()
+            if line.count(':') >= 3 and (match := _GOCONST_RE.match(line))
+        ]
     
     def get_architecture_analysis(self) -> List[ArchitectureViolation]:
         """Run go-cleanarch for architecture analysis."""
-        print("🏗️  Analyzing architecture...")
+        self._log("🏗️  Analyzing architecture...")
         
         try:
-            result = subprocess.run(['go-cleanarch'], 
-                                  capture_output=True, 
-                                  text=True, 
-                                  check=False)
+            result = self._run_tool(['go-cleanarch'])
             
-            return self._parse_cleanarch_output(result.stdout, result.stderr)
+            violations = self._parse_cleanarch_output(result.stdout, result.stderr)
+            # A non-zero exit is expected with violations, an error without them
+            if result.returncode != 0 and not violations:
+                self._mark_failed()
+            return violations
             
         except subprocess.SubprocessError as e:
-            print(f"⚠️  Error running go-cleanarch: {e}")
+            self._log(f"⚠️  Error running go-cleanarch: {e}")
+            self._mark_failed()
             return []
     
     def _parse_cleanarch_output(self, stdout: str, stderr: str) -> List[ArchitectureViolation]:
@@ -433,7 +792,7 @@ class CodeAnalyzer:
         # go-cleanarch outputs to stderr for violations
         output = stderr if stderr.strip() else stdout
         
-        for line in output.strip().split('\n'):
+        for line in output.splitlines():
             if not line.strip() or "Clean Architecture" in line:
                 continue
                 
@@ -448,50 +807,40 @@ class CodeAnalyzer:
     
     def get_staticcheck_analysis(self) -> List[Dict[str, any]]:
         """Run staticcheck for advanced static analysis."""
-        print("🔬 Running staticcheck analysis...")
+        self._log("🔬 Running staticcheck analysis...")
         
         try:
-            packages = self._get_package_list()
-            if not packages:
-                return []
-                
-            cmd = ['staticcheck'] + packages
-            result = subprocess.run(cmd, 
-                                  capture_output=True, 
-                                  text=True, 
-                                  check=False)
+            cmd = ['staticcheck'] + self._packages_arg()
+            result = self._run_tool(cmd)
             
-            return self._parse_staticcheck_output(result.stdout)
+            issues = self._parse_staticcheck_output(result.stdout)
+            # staticcheck exits with 1 when it finds issues; any other exit,
+            # stderr output or unparsed stdout line means packages did not load
+            if (result.returncode not in (0, 1) or result.stderr.strip() or
+                    len(issues) != sum(1 for line in result.stdout.splitlines() if line.strip())):
+                self._mark_failed()
+            return issues
             
         except subprocess.SubprocessError as e:
-            print(f"⚠️  Error running staticcheck: {e}")
+            self._log(f"⚠️  Error running staticcheck: {e}")
+            self._mark_failed()
             return []
     
     def _parse_staticcheck_output(self, output: str) -> List[Dict[str, any]]:
         """Parse staticcheck output."""
-        issues = []
-        
-        for line in output.strip().split('\n'):
-            if not line.strip():
-                continue
-                
-            # Parse format: "./file.go:line:col: message (SA1000)"
-            match = re.match(r'^(.+):(\d+):(\d+):\s+(.+?)\s*(?:\(([^)]+)\))?$', line)
-            if match:
-                file_path = match.group(1)
-                # Truncate path to be relative to project root
-                if file_path.startswith('./'):
-                    file_path = file_path[2:]
-                
-                issues.append({
-                    'file': file_path,
-                    'line': match.group(2),
-                    'col': match.group(3),
-                    'message': match.group(4),
-                    'rule': match.group(5) if match.group(5) else 'staticcheck'
-                })
-        
-        return issues
+        # Parse format: "./file.go:line:col: message (SA1000)"
+        # Lines with fewer than three colons cannot match and skip the regex.
+        return [
+            {
+                'file': _strip_dot_slash(match.group(1)),
+                'line': match.group(2),
+                'col': match.group(3),
+                'message': match.group(4),
+                'rule': match.group(5) if match.group(5) else 'staticcheck'
+            }
+            for line in output.splitlines()
+            if line.count(':') >= 3 and (match := _STATICCHECK_RE.match(line))
+        ]
     
     def get_deadcode_analysis(self) -> List[Dict[str, any]]:
         """Run deadcode analysis to find unused code.
@@ -500,75 +849,52 @@ class CodeAnalyzer:
         helping distinguish actual dead code from untested public APIs.
         Filters out demo packages and public interface functions.
         """
-        print("💀 Detecting dead code...")
+        self._log("💀 Detecting dead code...")
         
         try:
-            packages = self._get_package_list()
-            if not packages:
-                return []
-                
-            cmd = ['deadcode', '-test'] + packages
-            result = subprocess.run(cmd, 
-                                  capture_output=True, 
-                                  text=True, 
-                                  check=False)
+            cmd = ['deadcode', '-test'] + self._packages_arg()
+            result = self._run_tool(cmd)
+            if result.returncode != 0 or result.stderr.strip():
+                self._mark_failed()
             
             return self._filter_deadcode_results(self._parse_deadcode_output(result.stdout))
             
         except subprocess.SubprocessError as e:
-            print(f"⚠️  Error running deadcode: {e}")
+            self._log(f"⚠️  Error running deadcode: {e}")
+            self._mark_failed()
             return []
     
     def _parse_deadcode_output(self, output: str) -> List[Dict[str, any]]:
         """Parse deadcode output."""
-        dead_items = []
-        
-        for line in output.strip().split('\n'):
-            if not line.strip():
-                continue
-                
-            # Parse format: "file.go:line:col: function Name is unused"
-            match = re.match(r'^(.+):(\d+):(\d+): (.+)$', line)
-            if match:
-                file_path = match.group(1)
-                if file_path.startswith('./'):
-                    file_path = file_path[2:]
-                
-                dead_items.append({
-                    'file': file_path,
-                    'line': match.group(2),
-                    'col': match.group(3),
-                    'message': match.group(4)
-                })
-        
-        return dead_items
+        # Parse format: "file.go:line:col: function Name is unused"
+        # Lines with fewer than three colons cannot match and skip the regex.
+        return [
+            {
+                'file': _strip_dot_slash(match.group(1)),
+                'line': match.group(2),
+                'col': match.group(3),
+                'message': match.group(4)
+            }
+            for line in output.splitlines()
+            if line.count(':') >= 3 and (match := _FILE_LINE_MSG_RE.match(line))
+        ]
     
     def _filter_deadcode_results(self, dead_code_items: List[Dict[str, any]]) -> List[Dict[str, any]]:
         """Filter dead code results based on configuration."""
         filtered_items = []
+        exclude_files = _substring_pattern(self.config.deadcode_exclude_files)
+        exclude_functions = _substring_pattern(self.config.deadcode_exclude_functions)
         
         for item in dead_code_items:
             file_path = item['file']
             message = item['message']
             
             # Skip files matching exclude patterns
-            should_skip_file = False
-            for exclude_pattern in self.config.deadcode_exclude_files:
-                if exclude_pattern in file_path or file_path.startswith(exclude_pattern):
-                    should_skip_file = True
-                    break
-            
-            if should_skip_file:
+            if exclude_files and exclude_files.search(file_path):
                 continue
             
             # Skip specific functions if configured
-            should_skip_func = False
-            for exclude_func in self.config.deadcode_exclude_functions:
-                if exclude_func in message:
-                    should_skip_func = True
-                    break
-            
-            if should_skip_func:
+            if exclude_functions and exclude_functions.search(message):
                 continue
             
             # Skip public functions in interface files if configured
@@ -593,23 +919,16 @@ class CodeAnalyzer:
     
     def get_vulnerability_analysis(self) -> List[Dict[str, any]]:
         """Run govulncheck for vulnerability analysis."""
-        print("🛡️  Checking for known vulnerabilities...")
+        self._log("🛡️  Checking for known vulnerabilities...")
         
         try:
-            packages = self._get_package_list()
-            if not packages:
-                return []
-                
-            cmd = ['govulncheck'] + packages
-            result = subprocess.run(cmd, 
-                                  capture_output=True, 
-                                  text=True, 
-                                  check=False)
+            cmd = ['govulncheck'] + self._packages_arg()
+            result = self._run_tool(cmd)
             
             return self._parse_govulncheck_output(result.stdout, result.stderr)
             
         except subprocess.SubprocessError as e:
-            print(f"⚠️  Error running govulncheck: {e}")
+            self._log(f"⚠️  Error running govulncheck: {e}")
             return []
     
     def _parse_govulncheck_output(self, stdout: str, stderr: str) -> List[Dict[str, any]]:
@@ -618,7 +937,7 @@ class CodeAnalyzer:
         output = stdout + stderr
         
         # Look for vulnerability patterns
-        lines = output.strip().split('\n')
+        lines = output.splitlines()
         for i, line in enumerate(lines):
             if 'vulnerability' in line.lower() or 'CVE-' in line:
                 vulnerabilities.append({
@@ -631,60 +950,49 @@ class CodeAnalyzer:
     
     def get_vet_analysis(self) -> List[Dict[str, any]]:
         """Run go vet for static analysis."""
-        print("🔍 Running go vet analysis...")
+        self._log("🔍 Running go vet analysis...")
         
         try:
-            packages = self._get_package_list()
-            if not packages:
-                return []
-                
-            cmd = ['go', 'vet'] + packages
-            result = subprocess.run(cmd, 
-                                  capture_output=True, 
-                                  text=True, 
-                                  check=False)
+            cmd = ['go', 'vet'] + self._packages_arg()
+            result = self._run_tool(cmd)
             
-            return self._parse_vet_output(result.stderr)  # go vet outputs to stderr
+            issues = self._parse_vet_output(result.stderr)  # go vet outputs to stderr
+            # Besides the issues, go vet only prints "# package" headers; any
+            # other line is an error such as a package that failed to load
+            if result.returncode != 0 and len(issues) != sum(
+                    1 for line in result.stderr.splitlines() if line.strip() and not line.startswith('#')):
+                self._mark_failed()
+            return issues
             
         except subprocess.SubprocessError as e:
-            print(f"⚠️  Error running go vet: {e}")
+            self._log(f"⚠️  Error running go vet: {e}")
+            self._mark_failed()
             return []
     
     def _parse_vet_output(self, output: str) -> List[Dict[str, any]]:
         """Parse go vet output."""
-        issues = []
-        
-        for line in output.strip().split('\n'):
-            if not line.strip():
-                continue
-                
-            # Parse format: "./file.go:line:col: message"
-            match = re.match(r'^(.+):(\d+):(\d+): (.+)$', line)
-            if match:
-                file_path = match.group(1)
-                # Truncate path to be relative to project root
-                if file_path.startswith('./'):
-                    file_path = file_path[2:]
-                
-                issues.append({
-                    'file': file_path,
-                    'line': match.group(2),
-                    'col': match.group(3),
-                    'message': match.group(4)
-                })
-        
-        return issues
+        # Parse format: "./file.go:line:col: message"
+        # Lines with fewer than three colons cannot match and skip the regex.
+        return [
+            {
+                'file': _strip_dot_slash(match.group(1)),
+                'line': match.group(2),
+                'col': match.group(3),
+                'message': match.group(4)
+            }
+            for line in output.splitlines()
+            if line.count(':') >= 3 and (match := _FILE_LINE_MSG_RE.match(line))
+        ]
     
     def get_code_metrics(self) -> CodeMetrics:
         """Gather overall code metrics."""
-        print("📊 Gathering code metrics...")
+        self._log("📊 Gathering code metrics...")
         
         # Count lines of code
         total_lines = self._count_lines_of_code()
         
         # Count Go files
-        go_files = len(list(self.project_root.glob('**/*.go'))) - \
-                  len(list(self.project_root.glob('**/vendor/**/*.go')))
+        go_files = len(self._list_go_files())
         
         # Count packages
         packages = self._count_packages()
@@ -703,66 +1011,63 @@ class CodeAnalyzer:
             package_metrics=package_metrics
         )
     
-    def _count_lines_of_code(self) -> int:
-        """Count total lines of Go code (excluding vendor and examples)."""
-        try:
-            cmd = ['find', '.', '-name', '*.go', '-not', '-path', './vendor/*']
+    def _list_go_files(self) -> List[str]:
+        """List Go files in a single walk of the project tree.
+        
+        vendor/, hidden directories and, if configured, examples/ are pruned
+        while walking rather than filtered out afterwards. The result is
+        cached for the lifetime of the analyzer.
+        """
+        if self._go_files_cache is None:
+            excluded = {'vendor'}
             if self.config.exclude_examples:
-                cmd.extend(['-not', '-path', './examples/*'])
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            
-            files = result.stdout.strip().split('\n')
-            if not files or files == ['']:
-                return 0
-                
-            wc_cmd = ['wc', '-l'] + files
-            wc_result = subprocess.run(wc_cmd, capture_output=True, text=True, check=True)
-            
-            lines = wc_result.stdout.strip().split('\n')
-            total_line = lines[-1]  # Last line contains total
-            return int(total_line.split()[0])
+                excluded.add('examples')
             
-        except (subprocess.SubprocessError, ValueError, IndexError):
-            return 0
+            self._go_files_cache = self._walk_go_files(excluded)
+        
+        return self._go_files_cache
+    
+    def _walk_go_files(self, excluded: set) -> List[str]:
+        """Walk the project tree for Go files, pruning hidden and excluded directories."""
+        go_files = []
+        pending = [str(self.project_root)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in excluded and not entry.name.startswith('.'):
+                                pending.append(entry.path)
+                        elif entry.name.endswith('.go') and entry.is_file():
+                            go_files.append(entry.path)
+            except OSError:
+                continue
+        
+        return go_files
+    
+    def _count_lines_of_code(self) -> int:
+        """Count total lines of Go code (excluding vendor and examples)."""
+        return sum(self._count_file_lines(self._list_go_files()))
     
     def _count_packages(self) -> int:
         """Count the number of Go packages."""
-        try:
-            result = subprocess.run(['go', 'list', './...'], 
-                                  capture_output=True, 
-                                  text=True, 
-                                  check=True)
-            packages = result.stdout.strip().split('\n')
-            packages = [p for p in packages if p.strip()]
-            
-            if self.config.exclude_examples:
-                packages = [p for p in packages if '/examples/' not in p]
-                
-            return len(packages)
-        except subprocess.SubprocessError:
-            return 0
+        return len(self._get_package_list())
     
     def _get_test_coverage(self) -> List[CoverageEntry]:
         """Get test coverage information."""
-        print("🧪 Getting test coverage...")
+        self._log("🧪 Getting test coverage...")
         
         try:
-            # Get packages and filter if needed
-            result = subprocess.run(['go', 'list', './...'], 
-                                  capture_output=True, text=True, check=True)
-            packages = [p.strip() for p in result.stdout.strip().split('\n') if p.strip()]
-            
-            if self.config.exclude_examples:
-                packages = [p for p in packages if '/examples/' not in p]
-            
+            packages = self._get_package_list()
             if not packages:
                 return []
                 
             # Run tests with coverage on filtered packages
-            result = subprocess.run(['go', 'test', '-cover'] + packages, 
-                                  capture_output=True, 
-                                  text=True, 
-                                  check=False)
+            cmd = ['go', 'test', '-cover']
+            if self.config.test_parallelism > 0:
+                cmd.extend([f'-p={self.config.test_parallelism}',
+                            f'-parallel={self.config.test_parallelism}'])
+            result = self._run_tool(cmd + packages)
             
             return self._parse_coverage_output(result.stdout)
         except subprocess.SubprocessError:
@@ -772,10 +1077,7 @@ class CodeAnalyzer:
         """Parse test coverage output."""
         entries = []
         
-        for line in output.strip().split('\n'):
-            if not line.strip():
-                continue
-            
+        for line in output.splitlines():
             # Parse "ok" lines: "ok  	github.com/tsupplis/batchexec/config	(cached)	coverage: 46.9% of statements"
             if line.startswith('ok'):
                 parts = line.split()
@@ -784,33 +1086,31 @@ class CodeAnalyzer:
                     cached = '(cached)' in line
                     status = 'ok (cached)' if cached else 'ok'
                     
-                    coverage_match = re.search(r'coverage: ([0-9.]+%)', line)
-                    coverage = coverage_match.group(1) if coverage_match else 'N/A'
+                    coverage_match = _COVERAGE_RE.search(line)
+                    coverage = (coverage_match and coverage_match.group(1)) or 'N/A'
                     
                     entries.append(CoverageEntry(package, status, coverage, cached))
             
             # Parse other package lines with coverage info
-            elif 'coverage:' in line:
-                parts = line.strip().split()
-                if parts:
-                    package = parts[0]
-                    coverage_match = re.search(r'coverage: ([0-9.]+%)', line)
-                    coverage = coverage_match.group(1) if coverage_match else 'N/A'
-                    
-                    entries.append(CoverageEntry(package, '-', coverage))
+            elif coverage_match := _COVERAGE_RE.search(line):
+                package = line.split(None, 1)[0]
+                entries.append(CoverageEntry(package, '-', coverage_match.group(1) or 'N/A'))
         
         return entries
     
-    def _parse_golangci_output(self, output: str) -> List[Dict[str, str]]:
-        """Parse golangci-lint output into structured data."""
+    def _parse_golangci_output(self, lines: Iterable[str]) -> List[Dict[str, str]]:
+        """Parse golangci-lint output lines into structured data."""
         issues = []
         
-        for line in output.strip().split('\n'):
-            if not line.strip():
+        for line in lines:
+            line = line.rstrip('\n')
+            
+            # Every issue ends with "(linter)"; skip other lines before the regex
+            if not line.endswith(')'):
                 continue
             
             # Parse format: "file.go:line:col: message (linter)"
-            match = re.match(r'^(.+):(\d+):(\d+):\s+(.+?)\s+\(([^)]+)\)$', line)
+            match = _GOLANGCI_RE.match(line)
             if match:
                 issues.append({
                     'file': match.group(1),
@@ -822,59 +1122,90 @@ class CodeAnalyzer:
         
         return issues
     
+    def _scan_package_dir(self, package_dir: str) -> Tuple[List[str], List[str]]:
+        """List a package directory's Go source and test files in one scan."""
+        go_files = []
+        test_files = []
+        
+        try:
+            with os.scandir(package_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not name.endswith('.go') or not entry.is_file():
+                        continue
+                    (test_files if name.endswith('_test.go') else go_files).append(entry.path)
+        except OSError:
+            pass
+        
+        return go_files, test_files
+    
+    def _count_file_lines(self, paths: List[str]) -> List[int]:
+        """Count the lines of each file, in the order given.
+        
+        Files are passed to `wc -l` in batches where it is available; any file
+        it did not report on is counted in Python on a thread pool instead.
+        """
+        counts = {}
+        
+        if os.name == 'posix' and self._command_exists('wc'):
+            for start in range(0, len(paths), _WC_BATCH_SIZE):
+                batch = paths[start:start + _WC_BATCH_SIZE]
+                try:
+                    result = self._run_tool(['wc', '-l', '--'] + batch)
+                except (OSError, ValueError, subprocess.SubprocessError):
+                    break
+                
+                # Lines are "<count> <path>", followed by a total when batch has several files
+                for line in result.stdout.splitlines():
+                    count, _, path = line.strip().partition(' ')
+                    if count.isdigit():
+                        counts[path] = int(count)
+        
+        missing = [path for path in paths if path not in counts]
+        if missing:
+            # Counting is bound by file I/O latency, so overlap it on a thread pool
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                counts.update(zip(missing, executor.map(_safe_count_lines, missing)))
+        
+        return [counts[path] for path in paths]
+    
     def _get_package_metrics(self) -> List[Dict[str, any]]:
         """Get detailed metrics per package."""
-        print("📊 Getting package-level metrics...")
+        self._log("📊 Getting package-level metrics...")
         
         package_metrics = []
+        files_to_count = []  # (package index, metric key, file path)
         
         try:
-            # Get list of packages
-            result = subprocess.run(['go', 'list', './...'], 
-                                  capture_output=True, 
-                                  text=True, 
-                                  check=True)
-            packages = [p.strip() for p in result.stdout.strip().split('\n') if p.strip()]
-            
-            for package in packages:
-                package_name = package.split('/')[-1] if '/' in package else package
+            for package in self._list_packages():
+                parts = package.split('/')
+                package_name = parts[-1]
                 
-                # Count Go files in package (use configurable pattern)
-                base_pattern = self.config.package_pattern.replace('*', 'tsupplis').replace('github.com/tsupplis/batchexec', '.')
-                package_dir = package.replace(package.split('/')[0] + '/' + package.split('/')[1] + '/' + package.split('/')[2], '.') if len(package.split('/')) >= 3 else '.'
+                # Count Go files in package, mapping the module path (host/owner/repo) to '.'
+                package_dir = package.replace('/'.join(parts[:3]), '.') if len(parts) >= 3 else '.'
                 if package_dir == '.' or package_dir == package:
                     package_dir = '.'
                 
-                go_files = list(Path(package_dir).glob('*.go')) if Path(package_dir).exists() else []
-                go_files = [f for f in go_files if not f.name.endswith('_test.go')]
-                test_files = list(Path(package_dir).glob('*_test.go')) if Path(package_dir).exists() else []
+                go_files, test_files = self._scan_package_dir(package_dir)
                 
-                # Count lines in package
-                lines = 0
-                test_lines = 0
-                
-                for file in go_files:
-                    try:
-                        with file.open('r', encoding='utf-8') as f:
-                            lines += len(f.readlines())
-                    except:
-                        pass
-                
-                for file in test_files:
-                    try:
-                        with file.open('r', encoding='utf-8') as f:
-                            test_lines += len(f.readlines())
-                    except:
-                        pass
+                # Lines are counted below, across all packages at once
+                index = len(package_metrics)
+                files_to_count.extend((index, 'lines', file) for file in go_files)
+                files_to_count.extend((index, 'test_lines', file) for file in test_files)
                 
                 package_metrics.append({
                     'package': package_name,
                     'full_package': package,
                     'go_files': len(go_files),
                     'test_files': len(test_files),
-                    'lines': lines,
-                    'test_lines': test_lines
+                    'lines': 0,
+                    'test_lines': 0
                 })
+            
+            counts = self._count_file_lines([file for _, _, file in files_to_count])
+            for (index, key, _), count in zip(files_to_count, counts):
+                package_metrics[index][key] += count
         
         except subprocess.SubprocessError:
             pass
@@ -886,43 +1217,18 @@ class CodeAnalyzer:
         print(f"📝 Generating code analysis report: {self.config.output_file}")
         
         # Get all analysis data
-        complexity_data = self.get_complexity_data()
-        cognitive_complexity = self.get_cognitive_complexity()
-        static_analysis = self.get_static_analysis()
-        vet_analysis = self.get_vet_analysis()
-        staticcheck_analysis = self.get_staticcheck_analysis()
-        security_issues = self.get_security_analysis()
-        vulnerabilities = self.get_vulnerability_analysis()
-        code_smells = self.get_code_smells()
-        deadcode_analysis = self.get_deadcode_analysis()
-        architecture_violations = self.get_architecture_analysis()
-        metrics = self.get_code_metrics()
-        
-        # Generate report
-        report_content = self._build_report(
-            complexity_data, 
-            cognitive_complexity,
-            static_analysis,
-            vet_analysis,
-            staticcheck_analysis,
-            security_issues,
-            vulnerabilities,
-            code_smells,
-            deadcode_analysis,
-            architecture_violations,
-            metrics
-        )
+        results = self.run_all()
         
-        # Write to file
+        # Write the report straight to the output file
         try:
             output_path = Path(self.config.output_file)
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with output_path.open('w', encoding='utf-8') as f:
-                f.write(report_content)
+            with output_path.open('w', encoding='utf-8', buffering=1 << 18) as f:
+                self._build_report(f, **results)
             
             print(f"✅ Analysis complete! Report generated: {self.config.output_file}")
-            self._print_summary(metrics)
+            self._print_summary(results['metrics'])
             return True
             
         except IOError as e:
@@ -930,6 +1236,7 @@ class CodeAnalyzer:
             return False
     
     def _build_report(self, 
+                      out: TextIO,
                       complexity_data: List[ComplexityEntry],
                       cognitive_complexity: List[ComplexityEntry], 
                       static_analysis: Dict[str, any],
@@ -940,31 +1247,26 @@ class CodeAnalyzer:
                       code_smells: List[CodeSmell],
                       deadcode_analysis: List[Dict[str, any]],
                       architecture_violations: List[ArchitectureViolation],
-                      metrics: CodeMetrics) -> str:
-        """Build the complete markdown report."""
-        
-        report_parts = [
-            self._build_header(),
-            self._build_complexity_section(complexity_data),
-            self._build_cognitive_complexity_section(cognitive_complexity),
-            self._build_static_analysis_section(static_analysis),
-            self._build_vet_section(vet_analysis),
-            self._build_staticcheck_section(staticcheck_analysis),
-            self._build_security_section(security_issues),
-            self._build_vulnerability_section(vulnerabilities),
-            self._build_code_smells_section(code_smells),
-            self._build_deadcode_section(deadcode_analysis),
-            self._build_architecture_section(architecture_violations),
-            self._build_metrics_section(metrics),
-            self._build_guidelines_section(),
-            self._build_footer()
-        ]
-        
-        return '\n'.join(report_parts)
+                      metrics: CodeMetrics) -> None:
+        """Write the complete markdown report to `out`."""
+        self._build_header(out)
+        self._build_complexity_section(out, complexity_data)
+        self._build_cognitive_complexity_section(out, cognitive_complexity)
+        self._build_static_analysis_section(out, static_analysis)
+        self._build_vet_section(out, vet_analysis)
+        self._build_staticcheck_section(out, staticcheck_analysis)
+        self._build_security_section(out, security_issues)
+        self._build_vulnerability_section(out, vulnerabilities)
+        self._build_code_smells_section(out, code_smells)
+        self._build_deadcode_section(out, deadcode_analysis)
+        self._build_architecture_section(out, architecture_violations)
+        self._build_metrics_section(out, metrics)
+        self._build_guidelines_section(out)
+        self._build_footer(out)
     
-    def _build_header(self) -> str:
-        """Build the report header."""
-        return """# Code Analysis Report
+    def _build_header(self, out: TextIO) -> None:
+        """Write the report header."""
+        out.write("""# Code Analysis Report
 
 *Generated automatically by `make analyze-code`*
 
@@ -976,85 +1278,72 @@ This report provides comprehensive code analysis including complexity, security,
 
 ### Top 10 Most Complex Functions
 
-"""
+
+""")
     
-    def _build_complexity_section(self, complexity_data: List[ComplexityEntry]) -> str:
-        """Build the complexity analysis section."""
-        sections = []
-        
+    def _build_complexity_section(self, out: TextIO, complexity_data: List[ComplexityEntry]) -> None:
+        """Write the complexity analysis section."""
         # Top 10 functions table
-        sections.append("| Complexity | Package | Function | File | Line |")
-        sections.append("|------------|---------|----------|------|------|")
+        out.write("| Complexity | Package | Function | File | Line |\n")
+        out.write("|------------|---------|----------|------|------|\n")
         
-        top_functions = complexity_data[:self.config.top_functions]
+        top_functions = self._top_complexity(complexity_data, self.config.top_functions)
         if top_functions:
-            for entry in top_functions:
-                complexity_emoji = self._get_complexity_emoji(entry.complexity)
-                sections.append(f"| {complexity_emoji} {entry.complexity} | `{entry.package}` | `{entry.function}` | `{entry.file}` | {entry.line} |")
+            out.writelines(f"| {self._get_complexity_emoji(entry.complexity)} {entry.complexity} | `{entry.package}` | `{entry.function}` | `{entry.file}` | {entry.line} |\n"
+                           for entry in top_functions)
         else:
-            sections.append("| - | - | No complexity data available | - | - |")
+            out.write("| - | - | No complexity data available | - | - |\n")
         
         # High complexity functions
-        sections.append("\n### Functions Requiring Attention (Complexity > 15)\n")
+        out.write("\n### Functions Requiring Attention (Complexity > 15)\n\n")
         
-        high_complexity = [e for e in complexity_data if e.complexity > self.config.complexity_threshold]
+        high_complexity = sorted((e for e in complexity_data if e.complexity > self.config.complexity_threshold),
+                                 key=lambda x: x.complexity, reverse=True)
         if high_complexity:
-            sections.append("| Complexity | Package | Function | File | Line | Priority |")
-            sections.append("|------------|---------|----------|------|------|----------|")
-            
-            for entry in high_complexity:
-                complexity_emoji = self._get_complexity_emoji(entry.complexity)
-                priority = self._get_priority_level(entry.complexity)
-                sections.append(f"| {complexity_emoji} {entry.complexity} | `{entry.package}` | `{entry.function}` | `{entry.file}` | {entry.line} | {priority} |")
+            out.write("| Complexity | Package | Function | File | Line | Priority |\n")
+            out.write("|------------|---------|----------|------|------|----------|\n")
+            out.writelines(f"| {self._get_complexity_emoji(entry.complexity)} {entry.complexity} | `{entry.package}` | `{entry.function}` | `{entry.file}` | {entry.line} | {self._get_priority_level(entry.complexity)} |\n"
+                           for entry in high_complexity)
         else:
-            sections.append("✅ **No high-complexity functions found** - All functions are below the complexity threshold!")
-        
-        return '\n'.join(sections)
+            out.write("✅ **No high-complexity functions found** - All functions are below the complexity threshold!\n")
     
-    def _build_static_analysis_section(self, static_analysis: Dict[str, any]) -> str:
-        """Build the static analysis section."""
-        sections = ["\n## Static Analysis Results\n"]
+    def _build_static_analysis_section(self, out: TextIO, static_analysis: Dict[str, any]) -> None:
+        """Write the static analysis section."""
+        out.write("\n## Static Analysis Results\n\n")
         
         if static_analysis['error']:
-            sections.append("### Configuration Issues\n")
-            sections.append("⚠️ **Warning**: There were issues running static analysis:")
-            sections.append(f"```\n{static_analysis['error']}\n```\n")
+            out.write("### Configuration Issues\n\n")
+            out.write("⚠️ **Warning**: There were issues running static analysis:\n")
+            out.write(f"```\n{static_analysis['error']}\n```\n\n")
         
         if static_analysis['issues']:
-            sections.append("### Code Quality Issues\n")
-            sections.append("| File | Line | Column | Issue | Linter |")
-            sections.append("|------|------|--------|-------|--------|")
-            
-            for issue in static_analysis['issues']:
-                file_path = f"`{issue['file']}`"
-                sections.append(f"| {file_path} | {issue['line']} | {issue['col']} | {issue['message']} | `{issue['linter']}` |")
+            out.write("### Code Quality Issues\n\n")
+            out.write("| File | Line | Column | Issue | Linter |\n")
+            out.write("|------|------|--------|-------|--------|\n")
+            out.writelines(f"| `{issue['file']}` | {issue['line']} | {issue['col']} | {issue['message']} | `{issue['linter']}` |\n"
+                           for issue in static_analysis['issues'])
         elif static_analysis['success']:
-            sections.append("✅ **No code quality issues found!**")
-        
-        return '\n'.join(sections)
-    
-    def _build_metrics_section(self, metrics: CodeMetrics) -> str:
-        """Build the code metrics section."""
-        sections = [
-            "\n## Code Metrics\n",
-            "### Project Overview\n",
-            f"- **Total Lines of Code:** {metrics.total_lines:,}",
-            f"- **Go Files:** {metrics.go_files}",
-            f"- **Packages:** {metrics.packages}",
-            "\n### Package Details\n"
-        ]
+            out.write("✅ **No code quality issues found!**\n")
+    
+    def _build_metrics_section(self, out: TextIO, metrics: CodeMetrics) -> None:
+        """Write the code metrics section."""
+        out.write("\n## Code Metrics\n\n")
+        out.write("### Project Overview\n\n")
+        out.write(f"- **Total Lines of Code:** {metrics.total_lines:,}\n")
+        out.write(f"- **Go Files:** {metrics.go_files}\n")
+        out.write(f"- **Packages:** {metrics.packages}\n")
+        out.write("\n### Package Details\n\n")
         
         if metrics.package_metrics:
-            sections.extend([
-                "| Package | Go Files | Test Files | Lines | Test Lines | Test Coverage |",
-                "|---------|----------|------------|-------|------------|---------------|"
-            ])
+            out.write("| Package | Go Files | Test Files | Lines | Test Lines | Test Coverage |\n")
+            out.write("|---------|----------|------------|-------|------------|---------------|\n")
             
-            # Create a coverage lookup
-            coverage_map = {}
+            # Create coverage lookups by full and by short package name
+            coverage_by_full = {}
+            coverage_by_short = {}
             for entry in metrics.coverage_entries:
-                package_name = entry.package.split('/')[-1] if '/' in entry.package else entry.package
-                coverage_map[package_name] = entry.coverage
+                coverage_by_full[entry.package] = entry.coverage
+                coverage_by_short.setdefault(entry.package.rpartition('/')[2] or entry.package, entry.coverage)
             
             total_lines = 0
             total_test_lines = 0
@@ -1062,15 +1351,9 @@ This report provides comprehensive code analysis including complexity, security,
             total_test_files = 0
             
             for pkg in metrics.package_metrics:
-                coverage = coverage_map.get(pkg['package'], 'N/A')
-                if coverage == 'N/A':
-                    # Try with full package name
-                    for entry in metrics.coverage_entries:
-                        if entry.package == pkg['full_package']:
-                            coverage = entry.coverage
-                            break
+                coverage = coverage_by_full.get(pkg['full_package']) or coverage_by_short.get(pkg['package'], 'N/A')
                 
-                sections.append(f"| `{pkg['package']}` | {pkg['go_files']} | {pkg['test_files']} | {pkg['lines']:,} | {pkg['test_lines']:,} | {coverage} |")
+                out.write(f"| `{pkg['package']}` | {pkg['go_files']} | {pkg['test_files']} | {pkg['lines']:,} | {pkg['test_lines']:,} | {coverage} |\n")
                 
                 total_lines += pkg['lines']
                 total_test_lines += pkg['test_lines']
@@ -1078,59 +1361,39 @@ This report provides comprehensive code analysis including complexity, security,
                 total_test_files += pkg['test_files']
             
             # Add totals row
-            sections.append(f"| **TOTAL** | **{total_go_files}** | **{total_test_files}** | **{total_lines:,}** | **{total_test_lines:,}** | - |")
+            out.write(f"| **TOTAL** | **{total_go_files}** | **{total_test_files}** | **{total_lines:,}** | **{total_test_lines:,}** | - |\n")
         else:
-            sections.append("No package metrics available")
+            out.write("No package metrics available\n")
         
         # Add summary coverage table
-        sections.extend([
-            "\n### Test Coverage Summary\n",
-            "| Package | Status | Coverage |",
-            "|---------|--------|----------|"
-        ])
+        out.write("\n### Test Coverage Summary\n\n")
+        out.write("| Package | Status | Coverage |\n")
+        out.write("|---------|--------|----------|\n")
         
         if metrics.coverage_entries:
-            for entry in metrics.coverage_entries:
-                package_short = entry.package.split('/')[-1] if '/' in entry.package else entry.package
-                status_icon = "✅" if entry.status.startswith('ok') else "❌"
-                sections.append(f"| `{package_short}` | {status_icon} {entry.status} | {entry.coverage} |")
+            out.writelines(f"| `{entry.package.rpartition('/')[2] or entry.package}` | {'✅' if entry.status.startswith('ok') else '❌'} {entry.status} | {entry.coverage} |\n"
+                           for entry in metrics.coverage_entries)
         else:
-            sections.append("| - | ❌ Error | Unable to run tests |")
-        
-        return '\n'.join(sections)
+            out.write("| - | ❌ Error | Unable to run tests |\n")
     
-    def _build_cognitive_complexity_section(self, cognitive_complexity: List[ComplexityEntry]) -> str:
-        """Build the cognitive complexity section."""
-        sections = [
-            "## Cognitive Complexity Analysis",
-            "",
-            "### Top 10 Most Cognitively Complex Functions",
-            "",
-        ]
+    def _build_cognitive_complexity_section(self, out: TextIO, cognitive_complexity: List[ComplexityEntry]) -> None:
+        """Write the cognitive complexity section."""
+        out.write("## Cognitive Complexity Analysis\n\n")
+        out.write("### Top 10 Most Cognitively Complex Functions\n\n")
         
         if cognitive_complexity:
-            sections.extend([
-                "| Complexity | Package | Function | File | Line |",
-                "|------------|---------|----------|------|------|"
-            ])
-            
-            for entry in cognitive_complexity[:10]:
-                icon = "🔴" if entry.complexity > 25 else "🔶" if entry.complexity > 15 else "⚠️" if entry.complexity > 10 else "✅"
-                sections.append(
-                    f"| {icon} {entry.complexity} | `{entry.package}` | `{entry.function}` | `{entry.file}` | {entry.line} |"
-                )
+            out.write("| Complexity | Package | Function | File | Line |\n")
+            out.write("|------------|---------|----------|------|------|\n")
+            out.writelines(f"| {self._get_complexity_emoji(entry.complexity)} {entry.complexity} | `{entry.package}` | `{entry.function}` | `{entry.file}` | {entry.line} |\n"
+                           for entry in self._top_complexity(cognitive_complexity, 10))
         else:
-            sections.append("✅ **No complex functions found** - All functions have low cognitive complexity!")
+            out.write("✅ **No complex functions found** - All functions have low cognitive complexity!\n")
         
-        sections.extend(["", ""])
-        return '\n'.join(sections)
+        out.write("\n\n")
     
-    def _build_security_section(self, security_issues: List[SecurityIssue]) -> str:
-        """Build the security analysis section."""
-        sections = [
-            "## Security Analysis Results",
-            "",
-        ]
+    def _build_security_section(self, out: TextIO, security_issues: List[SecurityIssue]) -> None:
+        """Write the security analysis section."""
+        out.write("## Security Analysis Results\n\n")
         
         if security_issues:
             # Group by severity
@@ -1138,180 +1401,114 @@ This report provides comprehensive code analysis including complexity, security,
             medium_issues = [i for i in security_issues if i.severity.upper() == 'MEDIUM']
             low_issues = [i for i in security_issues if i.severity.upper() == 'LOW']
             
-            sections.extend([
-                f"### Security Issues Found: {len(security_issues)}",
-                "",
-                "| Severity | Rule | File | Line | Details |",
-                "|----------|------|------|------|---------|"
-            ])
+            out.write(f"### Security Issues Found: {len(security_issues)}\n\n")
+            out.write("| Severity | Rule | File | Line | Details |\n")
+            out.write("|----------|------|------|------|---------|\n")
             
-            for issue in high_issues + medium_issues + low_issues:
-                severity_icon = "🔴" if issue.severity.upper() == 'HIGH' else "🔶" if issue.severity.upper() == 'MEDIUM' else "🟡"
-                sections.append(
-                    f"| {severity_icon} {issue.severity} | `{issue.rule}` | `{issue.file}` | {issue.line} | {issue.details[:100]}{'...' if len(issue.details) > 100 else ''} |"
-                )
+            for severity_icon, issues in (("🔴", high_issues), ("🔶", medium_issues), ("🟡", low_issues)):
+                out.writelines(f"| {severity_icon} {issue.severity} | `{issue.rule}` | `{issue.file}` | {issue.line} | {issue.details[:100]}{'...' if len(issue.details) > 100 else ''} |\n"
+                               for issue in issues)
         else:
-            sections.append("✅ **No security issues found** - Great job maintaining secure code!")
+            out.write("✅ **No security issues found** - Great job maintaining secure code!\n")
         
-        sections.extend(["", ""])
-        return '\n'.join(sections)
+        out.write("\n\n")
     
-    def _build_code_smells_section(self, code_smells: List[CodeSmell]) -> str:
-        """Build the code smells section."""
-        sections = [
-            "## Code Quality Issues",
-            "",
-        ]
+    def _build_code_smells_section(self, out: TextIO, code_smells: List[CodeSmell]) -> None:
+        """Write the code smells section."""
+        out.write("## Code Quality Issues\n\n")
         
         if code_smells:
-            sections.extend([
-                f"### Code Smells Found: {len(code_smells)}",
-                "",
-                "| Type | File | Line | Issue |",
-                "|------|------|------|-------|"
-            ])
-            
-            for smell in code_smells[:20]:  # Limit to top 20
-                sections.append(
-                    f"| 👃 {smell.type.replace('_', ' ').title()} | `{smell.file}` | {smell.line} | {smell.message} |"
-                )
+            out.write(f"### Code Smells Found: {len(code_smells)}\n\n")
+            out.write("| Type | File | Line | Issue |\n")
+            out.write("|------|------|------|-------|\n")
+            out.writelines(f"| 👃 {smell.type.replace('_', ' ').title()} | `{smell.file}` | {smell.line} | {smell.message} |\n"
+                           for smell in code_smells[:20])  # Limit to top 20
             
             if len(code_smells) > 20:
-                sections.append(f"*... and {len(code_smells) - 20} more issues*")
+                out.write(f"*... and {len(code_smells) - 20} more issues*\n")
         else:
-            sections.append("✅ **No code smells detected** - Code is clean and well-structured!")
+            out.write("✅ **No code smells detected** - Code is clean and well-structured!\n")
         
-        sections.extend(["", ""])
-        return '\n'.join(sections)
+        out.write("\n\n")
     
-    def _build_architecture_section(self, violations: List[ArchitectureViolation]) -> str:
-        """Build the architecture analysis section."""
-        sections = [
-            "## Architecture Analysis",
-            "",
-        ]
+    def _build_architecture_section(self, out: TextIO, violations: List[ArchitectureViolation]) -> None:
+        """Write the architecture analysis section."""
+        out.write("## Architecture Analysis\n\n")
         
         if violations:
-            sections.extend([
-                f"### Architecture Violations Found: {len(violations)}",
-                "",
-                "| Type | Details |",
-                "|------|---------|"
-            ])
-            
-            for violation in violations:
-                sections.append(
-                    f"| 🏗️ {violation.violation_type.replace('_', ' ').title()} | {violation.details} |"
-                )
+            out.write(f"### Architecture Violations Found: {len(violations)}\n\n")
+            out.write("| Type | Details |\n")
+            out.write("|------|---------|\n")
+            out.writelines(f"| 🏗️ {violation.violation_type.replace('_', ' ').title()} | {violation.details} |\n"
+                           for violation in violations)
         else:
-            sections.append("✅ **Clean Architecture Maintained** - No dependency violations detected!")
+            out.write("✅ **Clean Architecture Maintained** - No dependency violations detected!\n")
         
-        sections.extend(["", ""])
-        return '\n'.join(sections)
+        out.write("\n\n")
     
-    def _build_vet_section(self, vet_issues: List[Dict[str, any]]) -> str:
-        """Build the go vet analysis section."""
-        sections = [
-            "## Go Vet Analysis",
-            "",
-        ]
+    def _build_vet_section(self, out: TextIO, vet_issues: List[Dict[str, any]]) -> None:
+        """Write the go vet analysis section."""
+        out.write("## Go Vet Analysis\n\n")
         
         if vet_issues:
-            sections.extend([
-                f"### Go Vet Issues Found: {len(vet_issues)}",
-                "",
-                "| File | Line | Column | Issue |",
-                "|------|------|--------|-------|"
-            ])
-            
-            for issue in vet_issues:
-                sections.append(
-                    f"| `{issue['file']}` | {issue['line']} | {issue['col']} | {issue['message']} |"
-                )
+            out.write(f"### Go Vet Issues Found: {len(vet_issues)}\n\n")
+            out.write("| File | Line | Column | Issue |\n")
+            out.write("|------|------|--------|-------|\n")
+            out.writelines(f"| `{issue['file']}` | {issue['line']} | {issue['col']} | {issue['message']} |\n"
+                           for issue in vet_issues)
         else:
-            sections.append("✅ **No go vet issues found** - Code passes all built-in static checks!")
+            out.write("✅ **No go vet issues found** - Code passes all built-in static checks!\n")
         
-        sections.extend(["", ""])
-        return '\n'.join(sections)
+        out.write("\n\n")
     
-    def _build_staticcheck_section(self, staticcheck_issues: List[Dict[str, any]]) -> str:
-        """Build the staticcheck analysis section."""
-        sections = [
-            "## Staticcheck Analysis",
-            "",
-        ]
+    def _build_staticcheck_section(self, out: TextIO, staticcheck_issues: List[Dict[str, any]]) -> None:
+        """Write the staticcheck analysis section."""
+        out.write("## Staticcheck Analysis\n\n")
         
         if staticcheck_issues:
-            sections.extend([
-                f"### Staticcheck Issues Found: {len(staticcheck_issues)}",
-                "",
-                "| File | Line | Column | Issue | Rule |",
-                "|------|------|--------|-------|------|"
-            ])
-            
-            for issue in staticcheck_issues:
-                sections.append(
-                    f"| `{issue['file']}` | {issue['line']} | {issue['col']} | {issue['message']} | `{issue['rule']}` |"
-                )
+            out.write(f"### Staticcheck Issues Found: {len(staticcheck_issues)}\n\n")
+            out.write("| File | Line | Column | Issue | Rule |\n")
+            out.write("|------|------|--------|-------|------|\n")
+            out.writelines(f"| `{issue['file']}` | {issue['line']} | {issue['col']} | {issue['message']} | `{issue['rule']}` |\n"
+                           for issue in staticcheck_issues)
         else:
-            sections.append("✅ **No staticcheck issues found** - Code meets advanced static analysis standards!")
+            out.write("✅ **No staticcheck issues found** - Code meets advanced static analysis standards!\n")
         
-        sections.extend(["", ""])
-        return '\n'.join(sections)
+        out.write("\n\n")
     
-    def _build_deadcode_section(self, deadcode_items: List[Dict[str, any]]) -> str:
-        """Build the dead code analysis section."""
-        sections = [
-            "## Dead Code Analysis",
-            "",
-        ]
+    def _build_deadcode_section(self, out: TextIO, deadcode_items: List[Dict[str, any]]) -> None:
+        """Write the dead code analysis section."""
+        out.write("## Dead Code Analysis\n\n")
         
         if deadcode_items:
-            sections.extend([
-                f"### Unused Code Found: {len(deadcode_items)}",
-                "",
-                "| File | Line | Column | Unused Item |",
-                "|------|------|--------|-------------|"
-            ])
-            
-            for item in deadcode_items:
-                sections.append(
-                    f"| `{item['file']}` | {item['line']} | {item['col']} | {item['message']} |"
-                )
+            out.write(f"### Unused Code Found: {len(deadcode_items)}\n\n")
+            out.write("| File | Line | Column | Unused Item |\n")
+            out.write("|------|------|--------|-------------|\n")
+            out.writelines(f"| `{item['file']}` | {item['line']} | {item['col']} | {item['message']} |\n"
+                           for item in deadcode_items)
         else:
-            sections.append("✅ **No unused code found** - All functions are properly utilized!")
+            out.write("✅ **No unused code found** - All functions are properly utilized!\n")
         
-        sections.extend(["", ""])
-        return '\n'.join(sections)
+        out.write("\n\n")
     
-    def _build_vulnerability_section(self, vulnerabilities: List[Dict[str, any]]) -> str:
-        """Build the vulnerability analysis section."""
-        sections = [
-            "## Vulnerability Analysis (govulncheck)",
-            "",
-        ]
+    def _build_vulnerability_section(self, out: TextIO, vulnerabilities: List[Dict[str, any]]) -> None:
+        """Write the vulnerability analysis section."""
+        out.write("## Vulnerability Analysis (govulncheck)\n\n")
         
         if vulnerabilities:
-            sections.extend([
-                f"### Known Vulnerabilities Found: {len(vulnerabilities)}",
-                "",
-                "| Type | Details |",
-                "|------|---------|"
-            ])
-            
-            for vuln in vulnerabilities:
-                sections.append(
-                    f"| 🚨 {vuln['type'].title()} | {vuln['message']} |"
-                )
+            out.write(f"### Known Vulnerabilities Found: {len(vulnerabilities)}\n\n")
+            out.write("| Type | Details |\n")
+            out.write("|------|---------|\n")
+            out.writelines(f"| 🚨 {vuln['type'].title()} | {vuln['message']} |\n"
+                           for vuln in vulnerabilities)
         else:
-            sections.append("✅ **No known vulnerabilities found** - Dependencies are secure!")
+            out.write("✅ **No known vulnerabilities found** - Dependencies are secure!\n")
         
-        sections.extend(["", ""])
-        return '\n'.join(sections)
+        out.write("\n\n")
     
-    def _build_guidelines_section(self) -> str:
-        """Build the complexity guidelines section."""
-        return """
+    def _build_guidelines_section(self, out: TextIO) -> None:
+        """Write the complexity guidelines section."""
+        out.write("""
 ## Complexity Guidelines
 
 ### Cyclomatic Complexity Scale
@@ -1341,41 +1538,28 @@ Based on the analysis above:
 - **Strategy Pattern**: For multiple algorithmic approaches
 
 ## Analysis Timestamp
-"""
+
+""")
     
-    def _build_footer(self) -> str:
-        """Build the report footer."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        return f"""
+    def _build_footer(self, out: TextIO) -> None:
+        """Write the report footer."""
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        out.write(f"""
 **Generated:** {timestamp}
 
 ---
 
 *To regenerate this report, run: `make analyze-code`*
 *Report location: `{self.config.output_file}`*
-"""
+""")
     
     def _get_complexity_emoji(self, complexity: int) -> str:
         """Get emoji based on complexity level."""
-        if complexity <= 10:
-            return "✅"
-        elif complexity <= 15:
-            return "⚠️"
-        elif complexity <= 25:
-            return "🔶"
-        else:
-            return "🔴"
+        return _COMPLEXITY_EMOJIS[bisect.bisect_left(_COMPLEXITY_EMOJI_LIMITS, complexity)]
     
     def _get_priority_level(self, complexity: int) -> str:
         """Get priority level based on complexity."""
-        if complexity >= 26:
-            return "🔴 **Critical**"
-        elif complexity >= 21:
-            return "🔶 **High**"
-        elif complexity >= 16:
-            return "⚠️ **Medium**"
-        else:
-            return "✅ **Low**"
+        return _PRIORITY_LEVELS[bisect.bisect_left(_PRIORITY_LIMITS, complexity)]
 
     def _print_summary(self, metrics: CodeMetrics) -> None:
         """Print a summary to console."""